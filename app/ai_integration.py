@@ -1,8 +1,12 @@
 # C:\Users\Home\com.lang.practice\Heart_Attack_Prediction\app\ai_integration.py
 
 import os
+import asyncio
+import hashlib
 import httpx
 import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Tuple, Type
 from dotenv import load_dotenv
 
 # Load the API key
@@ -13,17 +17,57 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-GEMINI_API_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+GEMINI_API_ENDPOINT = os.getenv(
+    "GEMINI_API_ENDPOINT",
+    "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent",
+)
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+
+# Backend selection for app/fastapi_app.py: "gemini" (REST), "gemini-sdk", "stub" (local stub server)
+# or "template" (offline). main.py defaults to "gemini-sdk" instead.
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+LLM_STUB_URL = os.getenv("LLM_STUB_URL", "http://127.0.0.1:8001")
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30"))
+# Deadline for upstream answers; unset or 0 disables the templated fallback
+LLM_LATENCY_BUDGET_MS = float(os.getenv("LLM_LATENCY_BUDGET_MS", "0"))
+
+# --- Deterministic pseudo-LLM ---
+_OPENERS = [
+    "Here is a general overview based on the information provided.",
+    "Thanks for your question. Here is some general guidance.",
+    "Below is an educational summary of the relevant points.",
+]
+_ADVICE = [
+    "Regular exercise, a balanced diet and not smoking all support heart health.",
+    "Keeping blood pressure and cholesterol in a healthy range lowers cardiovascular risk.",
+    "Routine check-ups help catch risk factors such as high blood pressure early.",
+]
+_DISCLAIMER = "This is for educational purposes only; please consult a healthcare professional."
 
-headers = {
-    "Content-Type": "application/json",
-    "x-goog-api-key": GEMINI_API_KEY
-}
 
-async def generate_response(prompt: str, temperature: float = 0.7) -> str:
-    logger.info(f"Sending prompt to Gemini: {prompt}")
+def template_response(prompt: str, probability: Optional[float] = None) -> str:
+    """Build a deterministic answer for `prompt`, optionally citing the ML probability (0-100)."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    parts = [_OPENERS[digest[0] % len(_OPENERS)]]
+    if probability is not None:
+        if probability >= 50:
+            level = "elevated"
+        elif probability >= 25:
+            level = "moderate"
+        else:
+            level = "lower"
+        parts.append(
+            f"Our statistical model estimates a {probability:.2f}% probability of a heart attack, "
+            f"which suggests {level} risk."
+        )
+    parts.append(_ADVICE[digest[1] % len(_ADVICE)])
+    parts.append(_DISCLAIMER)
+    return " ".join(parts)
 
-    payload = {
+
+def build_payload(prompt: str, temperature: float = 0.7) -> dict:
+    """Build a generateContent request body."""
+    return {
         "contents": [
             {
                 "parts": [
@@ -39,17 +83,138 @@ async def generate_response(prompt: str, temperature: float = 0.7) -> str:
         }
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(GEMINI_API_ENDPOINT, headers=headers, json=payload)
+# --- Backends ---
+class LLMBackend(ABC):
+    """Interface for text generation backends."""
+
+    name = "base"
+    # Exceptions a backend raises when its own deadline expires
+    timeout_errors: Tuple[Type[BaseException], ...] = ()
+
+    @abstractmethod
+    async def generate(self, prompt: str, temperature: float = 0.7, timeout: Optional[float] = None) -> str:
+        """Return the generated text; `timeout` (seconds) caps the upstream request."""
+
+
+class GeminiRESTBackend(LLMBackend):
+    """Calls a generateContent endpoint over HTTP."""
+
+    name = "gemini"
+    timeout_errors = (httpx.TimeoutException,)
+
+    def __init__(self, endpoint: str = GEMINI_API_ENDPOINT, api_key: Optional[str] = GEMINI_API_KEY,
+                 timeout: float = LLM_TIMEOUT):
+        self.endpoint = endpoint
+        self.headers = {"Content-Type": "application/json", "x-goog-api-key": api_key or ""}
+        self.timeout = timeout
+
+    async def generate(self, prompt: str, temperature: float = 0.7, timeout: Optional[float] = None) -> str:
+        timeout = min(self.timeout, timeout) if timeout else self.timeout
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            response = await client.post(self.endpoint, headers=self.headers, json=build_payload(prompt, temperature))
             response.raise_for_status()
             result = response.json()
-            logger.info(f"Gemini Response: {result}")
+            logger.info(f"{self.name} response: {result}")
             return result['candidates'][0]['content']['parts'][0]['text']
 
-    except httpx.HTTPStatusError as http_err:
-        logger.error(f"HTTP error occurred: {http_err} - Response content: {http_err.response.text}")
-        return f"HTTP error: {http_err.response.status_code} - {http_err.response.text}"
+
+class StubBackend(GeminiRESTBackend):
+    """Calls the local stub server (`app.llm_stub_server`)."""
+
+    name = "stub"
+
+    def __init__(self, base_url: str = LLM_STUB_URL, model_name: str = GEMINI_MODEL, timeout: float = LLM_TIMEOUT):
+        super().__init__(
+            endpoint=f"{base_url.rstrip('/')}/v1beta/models/{model_name}:generateContent",
+            api_key="stub",
+            timeout=timeout,
+        )
+
+
+class GeminiSDKBackend(LLMBackend):
+    """Uses the `google.generativeai` SDK."""
+
+    name = "gemini-sdk"
+
+    def __init__(self, api_key: Optional[str] = GEMINI_API_KEY, model_name: str = GEMINI_MODEL,
+                 timeout: float = LLM_TIMEOUT):
+        import google.generativeai as genai
+        from google.api_core.exceptions import DeadlineExceeded
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+        self.timeout = timeout
+        self.timeout_errors = (DeadlineExceeded,)
+
+    async def generate(self, prompt: str, temperature: float = 0.7, timeout: Optional[float] = None) -> str:
+        timeout = min(self.timeout, timeout) if timeout else self.timeout
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config={"temperature": temperature},
+            request_options={"timeout": timeout},
+        )
+        return response.text.strip()
+
+
+class TemplateBackend(LLMBackend):
+    """Offline deterministic pseudo-LLM; useful for tests and benchmarks."""
+
+    name = "template"
+
+    async def generate(self, prompt: str, temperature: float = 0.7, timeout: Optional[float] = None) -> str:
+        return template_response(prompt)
+
+
+_BACKENDS = {
+    "gemini": GeminiRESTBackend,
+    "gemini-sdk": GeminiSDKBackend,
+    "stub": StubBackend,
+    "template": TemplateBackend,
+}
+_backend_cache: Dict[str, LLMBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> LLMBackend:
+    """Return the backend selected by `name` (default: `LLM_BACKEND`), creating it on first use."""
+    name = name or LLM_BACKEND
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown LLM backend: {name}")
+    if name not in _backend_cache:
+        _backend_cache[name] = _BACKENDS[name]()
+    return _backend_cache[name]
+
+
+def _fallback_probability(probability_fn: Optional[Callable[[], Optional[float]]]) -> Optional[float]:
+    if probability_fn is None:
+        return None
+    try:
+        return probability_fn()
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return f"Unexpected error: {str(e)}"
+        logger.warning(f"Could not compute ML probability for fallback answer: {e}")
+        return None
+
+
+async def generate_response_within_budget(
+    prompt: str,
+    probability_fn: Optional[Callable[[], Optional[float]]] = None,
+    budget_ms: float = LLM_LATENCY_BUDGET_MS,
+    temperature: float = 0.7,
+    llm: Optional[LLMBackend] = None,
+) -> str:
+    """Generate a response, returning a templated answer if the upstream misses `budget_ms`.
+
+    `probability_fn` is only called on the fallback path. Backend errors other than a
+    missed deadline propagate to the caller.
+    """
+    llm = llm or get_backend()
+    logger.info(f"Sending prompt to {llm.name}: {prompt}")
+    if not budget_ms or budget_ms <= 0:
+        return await llm.generate(prompt, temperature)
+
+    timeout = budget_ms / 1000
+    deadline_errors = (asyncio.TimeoutError, *llm.timeout_errors)
+    try:
+        return await asyncio.wait_for(llm.generate(prompt, temperature, timeout=timeout), timeout=timeout)
+    except deadline_errors:
+        logger.warning(f"LLM response exceeded {budget_ms:.0f} ms budget; using templated fallback.")
+        return template_response(prompt, _fallback_probability(probability_fn))
@@ -3,11 +3,11 @@
 import datetime
 from fastapi import FastAPI, HTTPException
 import logging
-from .ai_integration import generate_response
+from .ai_integration import generate_response_within_budget
+from .model_artifact import CompactHeartAttackModel, ModelArtifactError
 from pydantic import BaseModel
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
-import joblib
 import pandas as pd
 import numpy as np
 import os
@@ -66,16 +66,36 @@ class ChatRequest(BaseModel):
 BASE_DIR = Path(__file__).parent.resolve()
 MODEL_PATH = BASE_DIR / "model" / "Heart_Attack_model.joblib"
 SCALER_PATH = BASE_DIR / "model" / "Heart_Attack_scaler.joblib"
+COMPACT_MODEL_PATH = BASE_DIR / "model" / "Heart_Attack_model.json"
 METRICS_PATH = BASE_DIR / "model" / "metrics.json"
 
+model = None
+scaler = None
+compact_model = None
+
+# Prefer the compact JSON artifact; it loads without importing sklearn.
 try:
-    model = joblib.load(MODEL_PATH)
-    scaler = joblib.load(SCALER_PATH)
-    logger.info("Successfully loaded ML model and scaler.")
+    compact_model = CompactHeartAttackModel.load(
+        COMPACT_MODEL_PATH,
+        source_paths=(MODEL_PATH, SCALER_PATH),
+        expected_features=HeartAttackPredictionRequest.model_fields,
+    )
+    logger.info("Successfully loaded compact ML model artifact.")
 except FileNotFoundError:
-    model = None
-    scaler = None
-    logger.error("ML model or scaler not found. Prediction endpoint will be disabled.")
+    logger.info("Compact model artifact not found. Falling back to joblib model.")
+except (ModelArtifactError, OSError) as e:
+    logger.error(f"Invalid compact model artifact, falling back to joblib model: {e}")
+
+if compact_model is None:
+    try:
+        import joblib
+        model = joblib.load(MODEL_PATH)
+        scaler = joblib.load(SCALER_PATH)
+        logger.info("Successfully loaded ML model and scaler.")
+    except FileNotFoundError:
+        model = None
+        scaler = None
+        logger.error("ML model or scaler not found. Prediction endpoint will be disabled.")
 
 # --- Helper Functions ---
 def preprocess_input(data: HeartAttackPredictionRequest):
@@ -84,6 +104,14 @@ def preprocess_input(data: HeartAttackPredictionRequest):
     df = pd.DataFrame(data.dict(), index=[0])
     return scaler.transform(df)
 
+def ml_probability(data: HeartAttackPredictionRequest) -> Optional[float]:
+    """Return the ML heart attack probability (0-100), or None if no model is loaded."""
+    if compact_model:
+        return compact_model.predict_proba(data.dict()) * 100
+    if model:
+        return model.predict_proba(preprocess_input(data))[0][1] * 100
+    return None
+
 # --- API Endpoints ---
 
 # ✅ Endpoint 1: AI Chatbot
@@ -93,9 +121,9 @@ async def chat_with_assistant(request: ChatRequest):
     Handles chat interactions with the LifeBeat Health Assistant.
     """
     try:
-        # The new `generate_response` function handles the full conversation context.
+        # `generate_response_within_budget` handles the full conversation context.
         # We can enhance this later to include history for better context.
-        response_text = await generate_response(request.message)
+        response_text = await generate_response_within_budget(request.message)
         return {"response": response_text}
     except Exception as e:
         logger.error(f"Error in /chat endpoint: {e}")
@@ -128,7 +156,7 @@ async def predict_heart_attack_ai(data: HeartAttackPredictionRequest):
 
         Structure your response clearly. This is for educational purposes only.
         """
-        prediction = await generate_response(prompt)
+        prediction = await generate_response_within_budget(prompt, probability_fn=lambda: ml_probability(data))
         return {"prediction": prediction}
     except Exception as e:
         logger.error(f"Error in /predict_ai endpoint: {e}")
@@ -140,12 +168,10 @@ def predict_heart_attack_ml(data: HeartAttackPredictionRequest):
     """
     Predicts the probability of a heart attack using the trained ML model.
     """
-    if not model:
+    if not compact_model and not model:
         raise HTTPException(status_code=500, detail="ML model not loaded. Cannot make a prediction.")
     try:
-        preprocessed_data = preprocess_input(data)
-        prediction_proba = model.predict_proba(preprocessed_data)
-        probability = prediction_proba[0][1] * 100
+        probability = ml_probability(data)
 
         logger.info(f"ML Prediction Probability: {probability:.2f}%")
 
@@ -0,0 +1,127 @@
+# C:\Users\Home\com.lang.practice\LifeBeat\app\llm_stub_server.py
+
+import asyncio
+import json
+import logging
+import os
+from typing import List, Optional
+from fastapi import FastAPI, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+import uvicorn
+
+from .ai_integration import template_response
+
+# Configure logging
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# Simulated upstream latency
+STUB_LATENCY_MS = float(os.getenv("LLM_STUB_LATENCY_MS", "0"))
+STUB_CHUNK_LATENCY_MS = float(os.getenv("LLM_STUB_CHUNK_LATENCY_MS", "0"))
+STUB_CHUNK_WORDS = int(os.getenv("LLM_STUB_CHUNK_WORDS", "8"))
+
+if STUB_CHUNK_WORDS <= 0:
+    raise ValueError("LLM_STUB_CHUNK_WORDS must be a positive integer")
+
+app = FastAPI(
+    title="LifeBeat LLM Stub",
+    description="Local stand-in for the Gemini generateContent API, for offline runs and load tests",
+    version="1.0.0"
+)
+
+# --- Pydantic Models ---
+class Part(BaseModel):
+    text: str = ""
+
+class Content(BaseModel):
+    role: Optional[str] = None
+    parts: List[Part]
+
+class GenerateContentRequest(BaseModel):
+    contents: List[Content]
+
+# Mirror Gemini's error body for malformed requests; other validation errors keep FastAPI's 422
+@app.exception_handler(RequestValidationError)
+async def invalid_argument_handler(request: Request, exc: RequestValidationError):
+    if not any(error.get("loc") and error["loc"][0] == "body" for error in exc.errors()):
+        return await request_validation_exception_handler(request, exc)
+    return JSONResponse(
+        status_code=400,
+        content={
+            "error": {
+                "code": 400,
+                "message": "Invalid JSON payload received.",
+                "status": "INVALID_ARGUMENT",
+                "details": jsonable_encoder(exc.errors()),
+            }
+        },
+    )
+
+# --- Helper Functions ---
+def extract_prompt(body: GenerateContentRequest) -> str:
+    return "\n".join(part.text for content in body.contents for part in content.parts)
+
+def candidate(text: str, finish_reason: Optional[str] = "STOP") -> dict:
+    result = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+    if finish_reason:
+        result["finishReason"] = finish_reason
+    return {
+        "candidates": [result],
+        "usageMetadata": {"totalTokenCount": len(text.split())},
+    }
+
+def chunk_text(text: str, size: int):
+    words = text.split(" ")
+    for i in range(0, len(words), size):
+        yield " ".join(words[i:i + size]) + (" " if i + size < len(words) else "")
+
+async def simulate_latency(latency_ms: Optional[float]) -> None:
+    # Per-request override, e.g. ?latency_ms=500
+    delay_ms = STUB_LATENCY_MS if latency_ms is None else latency_ms
+    if delay_ms > 0:
+        await asyncio.sleep(delay_ms / 1000)
+
+# --- API Endpoints ---
+@app.post("/v1beta/models/{model}:generateContent")
+async def generate_content(model: str, body: GenerateContentRequest,
+                           latency_ms: Optional[float] = Query(None, ge=0)):
+    await simulate_latency(latency_ms)
+    return candidate(template_response(extract_prompt(body)))
+
+@app.post("/v1beta/models/{model}:streamGenerateContent")
+async def stream_generate_content(model: str, body: GenerateContentRequest,
+                                  latency_ms: Optional[float] = Query(None, ge=0),
+                                  alt: Optional[str] = None):
+    text = template_response(extract_prompt(body))
+    sse = alt == "sse"
+
+    async def events():
+        await simulate_latency(latency_ms)
+        chunks = list(chunk_text(text, STUB_CHUNK_WORDS))
+        if not sse:
+            yield "["
+        for i, chunk in enumerate(chunks):
+            if i:
+                if STUB_CHUNK_LATENCY_MS > 0:
+                    await asyncio.sleep(STUB_CHUNK_LATENCY_MS / 1000)
+                if not sse:
+                    yield ",\r\n"
+            payload = candidate(chunk, "STOP" if i == len(chunks) - 1 else None)
+            if sse:
+                yield f"data: {json.dumps(payload)}\r\n\r\n"
+            else:
+                yield json.dumps(payload)
+        if not sse:
+            yield "]"
+
+    media_type = "text/event-stream" if sse else "application/json"
+    return StreamingResponse(events(), media_type=media_type)
+
+# ✅ Run the stub
+if __name__ == "__main__":
+    port = int(os.getenv("LLM_STUB_PORT", 8001))
+    uvicorn.run("app.llm_stub_server:app", host="127.0.0.1", port=port)
@@ -1,5 +1,11 @@
 import os
+import sys
+import json
 import logging
+
+if __name__ == "__main__" and not __package__:
+    sys.exit("Run this script from the repository root with: python -m app.model.train_model")
+
 import pandas as pd
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.linear_model import LogisticRegression
@@ -7,6 +13,7 @@ from sklearn.metrics import accuracy_score
 from sklearn.preprocessing import StandardScaler
 import joblib
 from pathlib import Path
+from app.model_artifact import build_artifact, file_sha256
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,6 +25,7 @@ DATA_PATH = PROJECT_ROOT / "data" / "Heart_Attack_data.csv"
 MODEL_DIR = PROJECT_ROOT / "app" / "model"
 SCALER_PATH = MODEL_DIR / "Heart_Attack_scaler.joblib"
 MODEL_PATH = MODEL_DIR / "Heart_Attack_model.joblib"
+COMPACT_MODEL_PATH = MODEL_DIR / "Heart_Attack_model.json"
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 RESULT_COLUMN = "output"
@@ -79,6 +87,28 @@ def evaluate_model(model, X_test, y_test) -> tuple[float, float]:
         logger.error(f"Error evaluating model: {e}")
         raise
 
+def export_compact_model(model: LogisticRegression, scaler: StandardScaler, feature_names, path: Path) -> None:
+    """Export coefficients and scaler parameters to a small versioned JSON artifact."""
+    try:
+        sources = {
+            p.name: file_sha256(p) for p in (MODEL_PATH, SCALER_PATH) if p.exists()
+        }
+        artifact = build_artifact(
+            feature_names=list(feature_names),
+            coef=model.coef_[0].tolist(),
+            intercept=float(model.intercept_[0]),
+            scaler_mean=scaler.mean_.tolist(),
+            scaler_scale=scaler.scale_.tolist(),
+            sources=sources,
+        )
+        ensure_directory_exists(path.parent)
+        with open(path, "w") as f:
+            json.dump(artifact, f, indent=2)
+        logger.info(f"Compact model artifact saved to: {path}")
+    except Exception as e:
+        logger.error(f"Error exporting compact model: {e}")
+        raise
+
 def main():
     """Main training pipeline."""
     try:
@@ -102,6 +132,8 @@ def main():
         X_train, X_test, y_train, y_test = split_data(X_normalized, y)
         model = train_and_save_model(X_train, y_train, MODEL_PATH)
         
+        export_compact_model(model, scaler, X.columns, COMPACT_MODEL_PATH)
+        
         accuracy, cv_score = evaluate_model(model, X_test, y_test)
         
         print(f"\n{'='*50}")
@@ -0,0 +1,156 @@
+# C:\Users\Home\com.lang.practice\LifeBeat\app\model_artifact.py
+
+import hashlib
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT = "lifebeat-logreg"
+ARTIFACT_VERSION = 1
+
+
+class ModelArtifactError(ValueError):
+    """Raised when a compact model artifact is malformed, stale or fails its checksum."""
+
+
+def params_checksum(params: Mapping) -> str:
+    """SHA-256 of the canonical JSON encoding of the model parameters."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_artifact(
+    feature_names: List[str],
+    coef: List[float],
+    intercept: float,
+    scaler_mean: List[float],
+    scaler_scale: List[float],
+    sources: Mapping[str, str] = None,
+) -> Dict:
+    """Build the JSON-serialisable artifact for a binary logistic regression + standard scaler."""
+    params = {
+        "features": list(feature_names),
+        "coef": [float(c) for c in coef],
+        "intercept": float(intercept),
+        "scaler_mean": [float(m) for m in scaler_mean],
+        "scaler_scale": [float(s) for s in scaler_scale],
+    }
+    return {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "params": params,
+        "sha256": params_checksum(params),
+        "sources": dict(sources or {}),
+    }
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _validate_params(params) -> None:
+    if not isinstance(params, dict):
+        raise ModelArtifactError("Artifact 'params' must be an object.")
+    features = params.get("features")
+    if not isinstance(features, list) or not features or not all(isinstance(f, str) for f in features):
+        raise ModelArtifactError("Artifact 'features' must be a non-empty list of strings.")
+    for key in ("coef", "scaler_mean", "scaler_scale"):
+        values = params.get(key)
+        if not isinstance(values, list) or not all(_is_number(v) for v in values):
+            raise ModelArtifactError(f"Artifact '{key}' must be a list of numbers.")
+        if len(values) != len(features):
+            raise ModelArtifactError(f"Artifact '{key}' length does not match the feature list.")
+    if not _is_number(params.get("intercept")):
+        raise ModelArtifactError("Artifact 'intercept' must be a number.")
+    if any(s == 0 for s in params["scaler_scale"]):
+        raise ModelArtifactError("Artifact 'scaler_scale' must not contain zeros.")
+
+
+class CompactHeartAttackModel:
+    """Logistic regression scorer loaded from a compact JSON artifact (no sklearn needed)."""
+
+    def __init__(self, features, coef, intercept, scaler_mean, scaler_scale):
+        self.features = tuple(features)
+        self.intercept = float(intercept)
+        # Fold the scaler into the linear model: w·((x - mean) / scale) + b == w'·x + b'
+        self._weights = tuple(float(w) / float(s) for w, s in zip(coef, scaler_scale))
+        self._bias = self.intercept - sum(
+            float(w) * float(m) / float(s) for w, m, s in zip(coef, scaler_mean, scaler_scale)
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        source_paths: Iterable[Path] = (),
+        expected_features: Optional[Iterable[str]] = None,
+    ) -> "CompactHeartAttackModel":
+        """Load and verify an artifact written by `train_model.export_compact_model`.
+
+        Any of `source_paths` that exist are checked against the digests recorded at
+        export time, so a stale artifact is rejected after the joblib files are retrained.
+        If `expected_features` is given, the artifact must use exactly that feature set.
+        """
+        try:
+            with open(path, "r") as f:
+                artifact = json.load(f)
+        except ValueError as e:
+            raise ModelArtifactError(f"Model artifact is not valid JSON: {e}") from e
+
+        if not isinstance(artifact, dict):
+            raise ModelArtifactError("Model artifact must be a JSON object.")
+        if artifact.get("format") != ARTIFACT_FORMAT:
+            raise ModelArtifactError(f"Unknown artifact format: {artifact.get('format')!r}")
+        if artifact.get("version") != ARTIFACT_VERSION:
+            raise ModelArtifactError(f"Unsupported artifact version: {artifact.get('version')!r}")
+
+        params = artifact.get("params")
+        _validate_params(params)
+        if params_checksum(params) != artifact.get("sha256"):
+            raise ModelArtifactError(f"Checksum mismatch for model artifact: {path}")
+        if expected_features is not None and set(params["features"]) != set(expected_features):
+            raise ModelArtifactError(
+                f"Artifact features {sorted(params['features'])} do not match "
+                f"expected features {sorted(expected_features)}."
+            )
+
+        sources = artifact.get("sources") or {}
+        if not isinstance(sources, dict):
+            raise ModelArtifactError("Artifact 'sources' must be an object.")
+        for source in source_paths:
+            source = Path(source)
+            if source.exists() and source.name in sources and file_sha256(source) != sources[source.name]:
+                raise ModelArtifactError(f"Model artifact is stale: {source.name} has changed since export.")
+
+        return cls(
+            params["features"],
+            params["coef"],
+            params["intercept"],
+            params["scaler_mean"],
+            params["scaler_scale"],
+        )
+
+    def predict_proba(self, data: Mapping[str, float]) -> float:
+        """Return the probability of the positive class for a single record."""
+        z = self._bias
+        for name, w in zip(self.features, self._weights):
+            z += w * float(data[name])
+        # Numerically stable sigmoid
+        if z >= 0:
+            return 1.0 / (1.0 + math.exp(-z))
+        e = math.exp(z)
+        return e / (1.0 + e)
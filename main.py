@@ -2,21 +2,21 @@ from fastapi import FastAPI, HTTPException
 from dotenv import load_dotenv
 from pydantic import BaseModel, validator
 import os
-import google.generativeai as genai
+from app.ai_integration import get_backend, generate_response_within_budget
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Get your Gemini API key from environment
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")  # default model
+# LLM backend: uses the google.generativeai SDK with GEMINI_MODEL unless overridden
+LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini-sdk")
 
-if not GEMINI_API_KEY:
+if LLM_BACKEND.startswith("gemini") and not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY is missing in environment")
 
-# Configure Gemini
-genai.configure(api_key=GEMINI_API_KEY)
-model = genai.GenerativeModel(GEMINI_MODEL)
+# Configure the LLM backend
+model = get_backend(LLM_BACKEND)
 
 # Initialize FastAPI
 app = FastAPI()
@@ -71,9 +71,9 @@ async def predict_heart_attack(data: dict):
             f"Return the result as a percentage."
         )
 
-        # Generate response from Gemini
-        response = model.generate_content(prompt)
-        prediction = response.text.strip()
+        # Generate response from the LLM backend (templated fallback if over budget)
+        response = await generate_response_within_budget(prompt, llm=model)
+        prediction = response.strip()
 
         return {"prediction": prediction}
 
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+
+from app import ai_integration
+from app.ai_integration import (
+    LLMBackend,
+    StubBackend,
+    TemplateBackend,
+    generate_response_within_budget,
+    get_backend,
+    template_response,
+)
+
+
+class SlowBackend(LLMBackend):
+    name = "slow"
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def generate(self, prompt, temperature=0.7, timeout=None):
+        await asyncio.sleep(self.delay)
+        return "upstream answer"
+
+
+class FailingBackend(LLMBackend):
+    name = "failing"
+
+    async def generate(self, prompt, temperature=0.7, timeout=None):
+        raise RuntimeError("invalid API key")
+
+
+def test_template_backend_is_deterministic():
+    backend = TemplateBackend()
+    first = asyncio.run(backend.generate("What is a normal resting heart rate?"))
+    second = asyncio.run(backend.generate("What is a normal resting heart rate?"))
+    assert first == second == template_response("What is a normal resting heart rate?")
+    assert first == (
+        "Here is a general overview based on the information provided. "
+        "Keeping blood pressure and cholesterol in a healthy range lowers cardiovascular risk. "
+        "This is for educational purposes only; please consult a healthcare professional."
+    )
+
+
+def test_template_response_cites_probability():
+    assert "62.50% probability" in template_response("prompt", probability=62.5)
+    assert "probability" not in template_response("prompt")
+
+
+def test_slow_backend_falls_back_within_budget():
+    start = time.perf_counter()
+    answer = asyncio.run(
+        generate_response_within_budget("prompt", probability_fn=lambda: 62.5, budget_ms=50, llm=SlowBackend(5))
+    )
+    assert time.perf_counter() - start < 1
+    assert answer == template_response("prompt", probability=62.5)
+
+
+def test_fast_backend_answers_within_budget():
+    calls = []
+    answer = asyncio.run(
+        generate_response_within_budget(
+            "prompt", probability_fn=lambda: calls.append(1), budget_ms=1000, llm=SlowBackend(0)
+        )
+    )
+    assert answer == "upstream answer"
+    assert calls == []
+
+
+def test_failing_probability_does_not_break_fallback():
+    def broken():
+        raise KeyError("age")
+
+    answer = asyncio.run(
+        generate_response_within_budget("prompt", probability_fn=broken, budget_ms=10, llm=SlowBackend(5))
+    )
+    assert answer == template_response("prompt")
+
+
+@pytest.mark.parametrize("budget_ms", [0, 1000])
+def test_backend_errors_propagate(budget_ms):
+    with pytest.raises(RuntimeError, match="invalid API key"):
+        asyncio.run(generate_response_within_budget("prompt", budget_ms=budget_ms, llm=FailingBackend()))
+
+
+def test_get_backend_is_cached(monkeypatch):
+    monkeypatch.setattr(ai_integration, "_backend_cache", {})
+    assert get_backend("template") is get_backend("template")
+    assert isinstance(get_backend("stub"), StubBackend)
+    with pytest.raises(ValueError):
+        get_backend("unknown")
+
+
+def test_llm_backend_is_abstract():
+    with pytest.raises(TypeError):
+        LLMBackend()
+
+
+def test_main_defaults_to_sdk_backend_with_gemini_model():
+    import os
+    import subprocess
+    import sys
+
+    pytest.importorskip("google.generativeai")
+    env = {k: v for k, v in os.environ.items() if k != "LLM_BACKEND"}
+    env.update(GEMINI_API_KEY="test-key", GEMINI_MODEL="gemini-2.0-flash")
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", "import main; print(main.model.name, main.model.model.model_name)"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["gemini-sdk", "models/gemini-2.0-flash"]
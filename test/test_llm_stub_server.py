@@ -0,0 +1,128 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+
+from app import llm_stub_server
+from app.ai_integration import StubBackend, build_payload, generate_response_within_budget, template_response
+
+PROMPT = "Explain what cholesterol is."
+MODEL_URL = "/v1beta/models/gemini-1.5-flash"
+
+
+@pytest.fixture
+def client():
+    return TestClient(llm_stub_server.app)
+
+
+def joined_text(chunks):
+    return "".join(c["candidates"][0]["content"]["parts"][0]["text"] for c in chunks)
+
+
+def test_generate_content(client):
+    response = client.post(f"{MODEL_URL}:generateContent", json=build_payload(PROMPT))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["candidates"][0]["content"]["parts"][0]["text"] == template_response(PROMPT)
+    assert body["candidates"][0]["finishReason"] == "STOP"
+
+
+def test_stream_generate_content_json_array(client):
+    response = client.post(f"{MODEL_URL}:streamGenerateContent", json=build_payload(PROMPT))
+    assert response.status_code == 200
+    chunks = json.loads(response.text)
+    assert len(chunks) > 1
+    assert joined_text(chunks) == template_response(PROMPT)
+    assert chunks[-1]["candidates"][0]["finishReason"] == "STOP"
+    assert all("finishReason" not in c["candidates"][0] for c in chunks[:-1])
+
+
+def test_stream_generate_content_sse(client):
+    response = client.post(
+        f"{MODEL_URL}:streamGenerateContent", params={"alt": "sse"}, json=build_payload(PROMPT)
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [e for e in response.text.split("\r\n\r\n") if e]
+    assert all(e.startswith("data: ") for e in events)
+    chunks = [json.loads(e[len("data: "):]) for e in events]
+    assert joined_text(chunks) == template_response(PROMPT)
+
+
+@pytest.mark.parametrize("endpoint", ["generateContent", "streamGenerateContent"])
+@pytest.mark.parametrize("latency_ms", ["abc", "-5"])
+def test_invalid_latency_is_rejected(client, endpoint, latency_ms):
+    response = client.post(
+        f"{MODEL_URL}:{endpoint}", params={"latency_ms": latency_ms}, json=build_payload(PROMPT)
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("endpoint", ["generateContent", "streamGenerateContent"])
+@pytest.mark.parametrize("body", [
+    "{not json",
+    "[]",
+    '{"contents": [{"parts": ["hi"]}]}',
+    "{}",
+])
+def test_malformed_body_returns_gemini_error(client, endpoint, body):
+    response = client.post(
+        f"{MODEL_URL}:{endpoint}", content=body, headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+    error = response.json()["error"]
+    assert error["code"] == 400
+    assert error["status"] == "INVALID_ARGUMENT"
+
+
+@pytest.mark.parametrize("words", ["0", "-1"])
+def test_non_positive_chunk_words_is_rejected(words):
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.llm_stub_server"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "LLM_STUB_CHUNK_WORDS": words},
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "LLM_STUB_CHUNK_WORDS must be a positive integer" in result.stderr
+
+
+@pytest.fixture
+def stub_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(llm_stub_server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+def test_stub_backend_round_trip(stub_url):
+    answer = asyncio.run(StubBackend(base_url=stub_url).generate(PROMPT))
+    assert answer == template_response(PROMPT)
+
+
+def test_slow_stub_falls_back_within_budget(stub_url, monkeypatch):
+    monkeypatch.setattr(llm_stub_server, "STUB_LATENCY_MS", 2000)
+    start = time.perf_counter()
+    answer = asyncio.run(
+        generate_response_within_budget(
+            PROMPT, probability_fn=lambda: 12.0, budget_ms=100, llm=StubBackend(base_url=stub_url)
+        )
+    )
+    assert time.perf_counter() - start < 1
+    assert answer == template_response(PROMPT, probability=12.0)
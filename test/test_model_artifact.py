@@ -0,0 +1,135 @@
+import json
+import math
+
+import pytest
+
+from app.model_artifact import (
+    ARTIFACT_VERSION,
+    CompactHeartAttackModel,
+    ModelArtifactError,
+    build_artifact,
+    file_sha256,
+    params_checksum,
+)
+
+FEATURES = ["age", "chol", "oldpeak"]
+COEF = [0.04, -0.01, -0.8]
+INTERCEPT = 0.3
+MEAN = [54.0, 246.0, 1.0]
+SCALE = [9.0, 51.0, 1.2]
+
+
+def write_artifact(tmp_path, artifact, name="model.json"):
+    path = tmp_path / name
+    path.write_text(json.dumps(artifact))
+    return path
+
+
+def unfolded_probability(record):
+    """StandardScaler.transform followed by LogisticRegression.predict_proba, by hand."""
+    z = INTERCEPT + sum(
+        w * (record[f] - m) / s for f, w, m, s in zip(FEATURES, COEF, MEAN, SCALE)
+    )
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+@pytest.fixture
+def artifact():
+    return build_artifact(FEATURES, COEF, INTERCEPT, MEAN, SCALE)
+
+
+@pytest.mark.parametrize("record", [
+    {"age": 63, "chol": 233, "oldpeak": 2.3},
+    {"age": 37, "chol": 250, "oldpeak": 3.5},
+    {"age": 29, "chol": 126, "oldpeak": 0.0},
+    {"age": 900, "chol": 0, "oldpeak": -40.0},
+])
+def test_folded_weights_match_unfolded_formula(tmp_path, artifact, record):
+    model = CompactHeartAttackModel.load(write_artifact(tmp_path, artifact))
+    assert model.predict_proba(record) == pytest.approx(unfolded_probability(record), rel=1e-12)
+
+
+def test_tampered_checksum_is_rejected(tmp_path, artifact):
+    artifact["params"]["coef"][0] = 9.0
+    with pytest.raises(ModelArtifactError, match="Checksum mismatch"):
+        CompactHeartAttackModel.load(write_artifact(tmp_path, artifact))
+
+
+def test_unsupported_version_is_rejected(tmp_path, artifact):
+    artifact["version"] = ARTIFACT_VERSION + 1
+    with pytest.raises(ModelArtifactError, match="Unsupported artifact version"):
+        CompactHeartAttackModel.load(write_artifact(tmp_path, artifact))
+
+
+@pytest.mark.parametrize("params", [
+    {"features": 5},
+    {"features": FEATURES, "coef": ["a", "b", "c"]},
+    {"features": FEATURES, "coef": COEF[:2]},
+])
+def test_malformed_params_are_rejected(tmp_path, artifact, params):
+    artifact["params"].update(params)
+    artifact["sha256"] = params_checksum(artifact["params"])
+    with pytest.raises(ModelArtifactError):
+        CompactHeartAttackModel.load(write_artifact(tmp_path, artifact))
+
+
+@pytest.mark.parametrize("content", ["[]", "{not json", "null"])
+def test_malformed_json_is_rejected(tmp_path, content):
+    path = tmp_path / "model.json"
+    path.write_text(content)
+    with pytest.raises(ModelArtifactError):
+        CompactHeartAttackModel.load(path)
+
+
+def test_expected_features_must_match(tmp_path, artifact):
+    path = write_artifact(tmp_path, artifact)
+
+    CompactHeartAttackModel.load(path, expected_features=list(reversed(FEATURES)))
+
+    with pytest.raises(ModelArtifactError, match="do not match expected features"):
+        CompactHeartAttackModel.load(path, expected_features=FEATURES + ["thal"])
+    with pytest.raises(ModelArtifactError, match="do not match expected features"):
+        CompactHeartAttackModel.load(path, expected_features=FEATURES[:2])
+
+
+def test_committed_artifact_matches_api_request_fields():
+    pytest.importorskip("fastapi")
+    from app.fastapi_app import COMPACT_MODEL_PATH, HeartAttackPredictionRequest
+
+    CompactHeartAttackModel.load(COMPACT_MODEL_PATH, expected_features=HeartAttackPredictionRequest.model_fields)
+
+
+def test_stale_sources_are_rejected(tmp_path):
+    source = tmp_path / "Heart_Attack_model.joblib"
+    source.write_bytes(b"original")
+    artifact = build_artifact(FEATURES, COEF, INTERCEPT, MEAN, SCALE, sources={source.name: file_sha256(source)})
+    path = write_artifact(tmp_path, artifact)
+
+    CompactHeartAttackModel.load(path, source_paths=[source])
+
+    source.write_bytes(b"retrained")
+    with pytest.raises(ModelArtifactError, match="stale"):
+        CompactHeartAttackModel.load(path, source_paths=[source])
+
+
+def test_committed_artifact_matches_sklearn_model():
+    joblib = pytest.importorskip("joblib")
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("sklearn")
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[1]
+    model_dir = root / "app" / "model"
+    model_path = model_dir / "Heart_Attack_model.joblib"
+    scaler_path = model_dir / "Heart_Attack_scaler.joblib"
+
+    compact = CompactHeartAttackModel.load(
+        model_dir / "Heart_Attack_model.json", source_paths=(model_path, scaler_path)
+    )
+    model = joblib.load(model_path)
+    scaler = joblib.load(scaler_path)
+
+    X = pd.read_csv(root / "data" / "Heart_Attack_data.csv").drop(columns=["output"])
+    expected = model.predict_proba(scaler.transform(X))[:, 1]
+    for record, proba in zip(X.to_dict("records"), expected):
+        assert compact.predict_proba(record) == pytest.approx(proba, abs=1e-12)